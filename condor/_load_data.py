@@ -29,20 +29,47 @@
 # General note:
 # All variables are in SI units by default. Exceptions explicit by variable name.
 # -----------------------------------------------------------------------------------------------------
-import pickle
 import os
+import numpy
 
+# The tables are stored as .npy files (written by devel/make_tables.py) that are indexed by the atomic number Z:
+#   elements.npy   - element symbol (abbreviation of the latin name)
+#   sw.npy         - standard atomic weight in unit Dalton
+#   sf.npy         - atomic scattering factors of all elements concatenated, rows: photon energy [eV], f1, f2
+#   sf_offsets.npy - rows sf_offsets[Z]:sf_offsets[Z+1] of sf.npy belong to the element with atomic number Z
+_table_names = ['elements', 'sw', 'sf', 'sf_offsets']
+
+def _cached(load):
+    # Tables are loaded only once per process and data directory
+    cache = {}
+    def cached_load(data_dir):
+        key = os.path.realpath(data_dir)
+        if key not in cache:
+            cache[key] = load(key)
+        return cache[key]
+    cached_load.__name__ = load.__name__
+    cached_load.__doc__ = load.__doc__
+    return cached_load
+
+@_cached
+def _load_tables(data_dir):
+    # Memory-mapped, pages are only read from disk when they are accessed
+    return dict((name, numpy.load(os.path.join(data_dir, name + '.npy'), mmap_mode='r')) for name in _table_names)
+
+@_cached
 def load_atomic_scattering_factors(data_dir):
-    with open(os.path.join(data_dir, 'sf.dat'), 'rb') as f:
-        atomic_scattering_factors = pickle.load(f)
-    return atomic_scattering_factors
+    tables = _load_tables(data_dir)
+    sf = tables['sf']
+    offsets = tables['sf_offsets']
+    # Slices of the memory-mapped table, no data is copied
+    return dict((str(element), sf[offsets[Z]:offsets[Z+1]]) for Z, element in enumerate(tables['elements']) if offsets[Z+1] > offsets[Z])
 
+@_cached
 def load_atomic_masses(data_dir):
-    with open(os.path.join(data_dir, 'sw.dat'), 'rb') as f:
-        atomic_masses = pickle.load(f)
-    return atomic_masses
+    tables = _load_tables(data_dir)
+    return dict((str(element), float(w)) for element, w in zip(tables['elements'], tables['sw']) if element)
 
+@_cached
 def load_atomic_numbers(data_dir):
-    with open(os.path.join(data_dir, 'z.dat'), 'rb') as f:
-        atomic_numbers = pickle.load(f)
-    return atomic_numbers
+    tables = _load_tables(data_dir)
+    return dict((str(element), Z) for Z, element in enumerate(tables['elements']) if element)
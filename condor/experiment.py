@@ -35,7 +35,7 @@
 # Take into account illumination profile
 
 from __future__ import print_function, absolute_import # Compatibility with python 2 and 3
-import numpy, os, sys, copy
+import numpy, os, sys, copy, re
 
 import logging
 logger = logging.getLogger(__name__)
@@ -44,6 +44,7 @@ from condor.utils.log import log,log_execution_time
 from condor.utils.log import log_and_raise_error,log_warning,log_info,log_debug
 import condor.utils.config
 from condor.utils.pixelmask import PixelMask
+import condor.utils.diffraction
 import condor.utils.sphere_diffraction
 import condor.utils.spheroid_diffraction
 import condor.utils.scattering_vector
@@ -53,6 +54,21 @@ import condor.particle
 import condor.utils.nfft
 
 
+# Particle models by prefix of the particle name. Longer prefixes have to come first because for example
+# "particle_spheroid" also starts with "particle_sphere".
+_particle_models = [
+    ("particle_spheroid", condor.particle.ParticleSpheroid),
+    ("particle_sphere",   condor.particle.ParticleSphere),
+    ("particle_map",      condor.particle.ParticleMap),
+    ("particle_atoms",    condor.particle.ParticleAtoms),
+]
+
+def _get_particle_model(name):
+    for prefix, model in _particle_models:
+        if name.startswith(prefix):
+            return model
+    return None
+
 def experiment_from_configfile(configfile):
     """
     Initialise Experiment instance from configuration file
@@ -86,19 +102,14 @@ def experiment_from_configdict(configdict):
     if len(particle_keys) == 0:
         log_and_raise_error(logger, "No particles defined.")
     for k in particle_keys:
-        if k.startswith("particle_sphere"):
-            particles[k] = condor.ParticleSphere(**configdict[k])
-        elif k.startswith("particle_spheroid"):
-            particles[k] = condor.ParticleSpheroid(**configdict[k])
-        elif k.startswith("particle_map"):
-            particles[k] = condor.ParticleMap(**configdict[k])
-        elif k.startswith("particle_atoms"):
-            particles[k] = condor.ParticleAtoms(**configdict[k])
-        else:
+        model = _get_particle_model(k)
+        if model is None:
             log_and_raise_error(logger,"Particle model for %s is not implemented." % k)
+        particles[k] = model(**configdict[k])
     # Detector
     detector = condor.Detector(**configdict["detector"])
-    experiment = Experiment(source, particles, detector)
+    # Experiment (optional section)
+    experiment = Experiment(source, particles, detector, **configdict.get("experiment", {}))
     return experiment
 
 
@@ -114,24 +125,23 @@ class Experiment:
       :particles: Dictionary of particle instances
 
       :detector: Detector instance
+
+    Kwargs:
+      :precision (str): Floating point precision of the output patterns, either ``'double'`` or ``'single'`` (default ``'double'``)
+
+        .. note:: With ``precision='single'`` the patterns are still calculated in double precision but returned as ``complex64`` / ``float32`` arrays, which halves their memory footprint. In a configuration file the precision is set in the optional ``[experiment]`` section.
     """
-    def __init__(self, source, particles, detector):
+    def __init__(self, source, particles, detector, precision="double"):
+        if precision not in ["double", "single"]:
+            log_and_raise_error(logger, "precision = \"%s\" is an invalid input. Has to be either \"double\" or \"single\"." % precision)
+        self.precision = precision
         self.source    = source
         for n,p in particles.items():
-            if n.startswith("particle_sphere"):
-                if not isinstance(p, condor.particle.ParticleSphere):
-                    log_and_raise_error(logger, "Particle %s is not a condor.particle.ParticleSphere instance." % n)
-            elif n.startswith("particle_spheroid"):
-                if not isinstance(p, condor.particle.ParticleSpheroid):
-                    log_and_raise_error(logger, "Particle %s is not a condor.particle.ParticleSpheroid instance." % n)
-            elif n.startswith("particle_map"):
-                if not isinstance(p, condor.particle.ParticleMap):
-                    log_and_raise_error(logger, "Particle %s is not a condor.particle.ParticleMap instance." % n)
-            elif n.startswith("particle_atoms"):
-                if not isinstance(p, condor.particle.ParticleAtoms):
-                    log_and_raise_error(logger, "Particle %s is not a condor.particle.ParticleAtoms instance." % n)
-            else:
-                log_and_raise_error(logger, "The particle model name %s is invalid. The name has to start with either particle_sphere, particle_spheroid, particle_map or particle_atoms.")
+            model = _get_particle_model(n)
+            if model is None:
+                log_and_raise_error(logger, "The particle model name %s is invalid. The name has to start with either particle_sphere, particle_spheroid, particle_map or particle_atoms." % n)
+            elif not isinstance(p, model):
+                log_and_raise_error(logger, "Particle %s is not a condor.particle.%s instance." % (n, model.__name__))
         self.particles = particles
         self.detector  = detector
         self._qmap_cache = {}
@@ -150,6 +160,7 @@ class Experiment:
         for n,p in self.particles.items():
             conf[n] = p.get_conf()
         conf.update(self.detector.get_conf())
+        conf["experiment"] = {"precision": self.precision}
         return conf
 
     def _get_next_particles(self):
@@ -319,9 +330,8 @@ class Experiment:
                 # Import here to make other functionalities of Condor independent of spsim
                 import spsim
                 # Check version
-                from distutils.version import StrictVersion
                 spsim_version_min = "0.1.0"
-                if not hasattr(spsim, "__version__") or StrictVersion(spsim.__version__) < StrictVersion(spsim_version_min):
+                if not hasattr(spsim, "__version__") or _version_tuple(spsim.__version__) < _version_tuple(spsim_version_min):
                     log_and_raise_error(logger, "Your spsim version is too old. Please install the newest spsim version and try again.")
                     sys.exit(0)
                 # Create options struct
@@ -392,6 +402,9 @@ class Experiment:
             P = 1.
         F_tot = numpy.sqrt(P) * F_tot
 
+        if self.precision == "single":
+            F_tot = F_tot.astype(numpy.complex64 if numpy.iscomplexobj(F_tot) else numpy.float32, copy=False)
+
         # Photon detection
         I_tot, M_tot = self.detector.detect_photons(abs(F_tot)**2)
         
@@ -503,19 +516,16 @@ class Experiment:
         """
         if wavelength is None:
             wavelength = self.source.photon.get_wavelength()
-        detector_distance = self.detector.distance
         if particle_diameter is None:
             if len(self.particles) == 1:
-                p = self.particles.values()[0]
+                p = next(iter(self.particles.values()))
             elif particle_key is None:
                 log_and_raise_error(logger, "You need to specify a particle_key because there are more than one particle models.")
             else:
                 p = self.particles[particle_key]
             particle_diameter = p.diameter_mean
-        pN = utils.diffraction.nyquist_pixel_size(wavelength, detector_distance, particle_diameter)
-        pD = self.detector.pixel_size
-        ratio = pN/pD
-        return ratio
+        pN = condor.utils.diffraction.nyquist_pixel_size(wavelength, self.detector.distance, particle_diameter)
+        return pN / self.detector.pixel_size
         
     def get_fresnel_number(self, wavelength):
         pass
@@ -568,6 +578,14 @@ class Experiment:
     # ------------------------------------------------------------------------------------------------
 
 
+def _version_tuple(version):
+    # "1.2.3rc1" -> (1, 2, 3), replaces distutils.version.StrictVersion (distutils is gone in Python >= 3.12)
+    v = [int(re.match(r"\d*", n).group() or 0) for n in version.split(".")]
+    # Trailing zeros are dropped so that for example "0.1" and "0.1.0" compare equal
+    while v and v[-1] == 0:
+        v.pop()
+    return tuple(v)
+
 def remove_from_dict(D, startswith="_"):
     for k,v in list(D.items()):
         if k.startswith(startswith):
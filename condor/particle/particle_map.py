@@ -285,7 +285,7 @@ class ParticleMap(AbstractContinuousParticle):
             if map3d_dataset is not None:
                 ds = map3d_dataset
             elif len(f.keys()) == 1:
-                ds = f.keys()[0]
+                ds = next(iter(f.keys()))
             else:
                 log_and_raise_error(logger, "No dataset specified where to find the map.")
             if len(f[ds].shape) == 4:
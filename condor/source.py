@@ -44,8 +44,17 @@ from condor.utils.log import log_and_raise_error,log_warning,log_info,log_debug
 from condor.utils.variation import Variation
 from condor.utils.photon import Photon
 from condor.utils.profile import Profile
+
+# Intensity units: (conversion factor from J/m2, whether to divide by the photon energy)
+_intensity_units = {
+    "J/m2"   : (1.,     False),
+    "ph/m2"  : (1.,     True),
+    "J/um2"  : (1.E-12, False),
+    "mJ/um2" : (1.E-9,  False),
+    "ph/um2" : (1.E-12, True),
+}
  
-class Source:
+class Source(object):
     """
     Class for an X-ray source
 
@@ -72,17 +81,35 @@ class Source:
       .. note:: The keyword arguments ``pulse_energy_variation``, ``pulse_energy_spread``, and ``pulse_energy_variation_n`` are passed on to :meth:`condor.source.Source.set_pulse_energy_variation` during initialisation. For more detailed information read the documentation of the method.
 
     """
+    # No per-instance __dict__, many Source instances may be created in ensemble simulations
+    __slots__ = ("photon", "_pulse_energy_mean", "profile", "polarization",
+                 "_pulse_energy_variation", "_pulse_energy_buffer", "_pulse_energy_buffer_index")
+
     def __init__(self, wavelength, focus_diameter, pulse_energy, profile_model=None, pulse_energy_variation=None, pulse_energy_spread=None, pulse_energy_variation_n=None, polarization="ignore"):
         self.photon = Photon(wavelength=wavelength)
         self.pulse_energy_mean = pulse_energy
         self.set_pulse_energy_variation(pulse_energy_variation, pulse_energy_spread, pulse_energy_variation_n)
         self.profile = Profile(model=profile_model, focus_diameter=focus_diameter)
         if polarization not in ["vertical", "horizontal", "unpolarized", "ignore"]:
-            log_and_raise_error(logger, "polarization = \"%s\" is an invalid input for initialization of Source instance.")
+            log_and_raise_error(logger, "polarization = \"%s\" is an invalid input for initialization of Source instance." % polarization)
             return
         self.polarization = polarization
         log_debug(logger, "Source configured")
 
+    @property
+    def pulse_energy_mean(self):
+        """
+        (Statistical mean of) pulse energy in unit Joule
+        """
+        return self._pulse_energy_mean
+
+    @pulse_energy_mean.setter
+    def pulse_energy_mean(self, pulse_energy_mean):
+        self._pulse_energy_mean = pulse_energy_mean
+        # Prefilled pulse energies were drawn for the old mean
+        self._pulse_energy_buffer = None
+        self._pulse_energy_buffer_index = 0
+
     def get_conf(self):
         """
         Get configuration in form of a dictionary. Another identically configured Source instance can be initialised by:
@@ -129,6 +156,20 @@ class Source:
             .. note:: The argument ``pulse_energy_variation_n`` takes effect only in combination with ``pulse_energy_variation=\'range\'``
         """
         self._pulse_energy_variation = Variation(pulse_energy_variation, pulse_energy_spread, pulse_energy_variation_n, number_of_dimensions=1)
+        self._pulse_energy_buffer = None
+        self._pulse_energy_buffer_index = 0
+
+    def prefill_pulse_energies(self, n):
+        """
+        Draw the pulse energies of the next ``n`` pulses at once
+
+        The following calls of :meth:`condor.source.Source.get_next` take their pulse energies from this buffer until it is exhausted. This avoids the overhead of drawing every pulse energy individually in long simulation runs.
+
+        Args:
+          :n (int): Number of pulse energies
+        """
+        self._pulse_energy_buffer = _draw_pulse_energies(self._pulse_energy_variation, self.pulse_energy_mean, n)
+        self._pulse_energy_buffer_index = 0
 
     def get_intensity(self, position, unit = "ph/m2", pulse_energy = None):
         """
@@ -157,22 +198,14 @@ class Source:
         # Assuming
         # 1) Radially symmetric profile that is invariant along the beam axis within the sample volume
         # 2) The variation of intensity are on much larger scale than the dimension of the particle size (i.e. flat wavefront)
-        r = numpy.sqrt(position[1]**2 + position[2]**2)
-        I = (self.profile.get_radial())(r) * (pulse_energy if pulse_energy is not None else self.pulse_energy_mean)
-        if unit == "J/m2":
-            pass
-        elif unit == "ph/m2":
-            I /= self.photon.get_energy() 
-        elif unit == "J/um2":
-            I *= 1.E-12
-        elif unit == "mJ/um2":
-            I *= 1.E-9
-        elif unit == "ph/um2":
-            I /= self.photon.get_energy()
-            I *= 1.E-12
-        else:
+        if unit not in _intensity_units:
             log_and_raise_error(logger, "%s is not a valid unit." % unit)
             return
+        factor, per_photon = _intensity_units[unit]
+        if per_photon:
+            factor /= self.photon.get_energy()
+        r2 = numpy.square(position[1]) + numpy.square(position[2])
+        I = self.profile.evaluate_radial_squared(r2) * ((pulse_energy if pulse_energy is not None else self.pulse_energy_mean) * factor)
         return I
 
     def get_next(self):
@@ -184,19 +217,61 @@ class Source:
                 "photon_energy":self.photon.get_energy(),
                 "photon_energy_eV":self.photon.get_energy_eV()}
 
+    def get_next_batch(self, n):
+        """
+        Iterate the parameters of the Source instance ``n`` times at once and return them as a dictionary
+
+        In contrast to :meth:`condor.source.Source.get_next` the pulse energies are returned as an array of length ``n``. Pulse energies remaining from :meth:`condor.source.Source.prefill_pulse_energies` are used first.
+
+        Args:
+          :n (int): Number of pulses
+        """
+        return {"pulse_energy":self._get_next_pulse_energies(n),
+                "wavelength":self.photon.get_wavelength(),
+                "photon_energy":self.photon.get_energy(),
+                "photon_energy_eV":self.photon.get_energy_eV()}
+
+    def _get_next_pulse_energies(self, n):
+        # Leading values are taken from the prefilled buffer so that the order of the pulse energies is preserved
+        p = numpy.zeros(0)
+        if self._pulse_energy_buffer is not None:
+            p = self._pulse_energy_buffer[self._pulse_energy_buffer_index:self._pulse_energy_buffer_index+n]
+            self._pulse_energy_buffer_index += len(p)
+        if len(p) < n:
+            p = numpy.concatenate((p, _draw_pulse_energies(self._pulse_energy_variation, self.pulse_energy_mean, n - len(p))))
+        return p
+
     def _get_next_pulse_energy(self):
+        if self._pulse_energy_buffer is not None and self._pulse_energy_buffer_index < len(self._pulse_energy_buffer):
+            p = self._pulse_energy_buffer[self._pulse_energy_buffer_index]
+            self._pulse_energy_buffer_index += 1
+            return float(p)
         p = self._pulse_energy_variation.get(self.pulse_energy_mean)
         # Non-random
         if self._pulse_energy_variation._mode in [None,"range"]:
             if p <= 0:
                 log_and_raise_error(logger, "Pulse energy smaller-equals zero. Change your configuration.")
             else:
-                return p
+                return float(p)
         # Random
         else:
             if p <= 0.:
                 log_warning(logger, "Pulse energy smaller-equals zero. Try again.")
-                self._get_next_pulse_energy()
+                return self._get_next_pulse_energy()
             else:
-                return p
-
+                return float(p)
+
+def _draw_pulse_energies(variation, pulse_energy_mean, n):
+    p = numpy.asarray(variation.get_batch(pulse_energy_mean, n), dtype=numpy.float64)
+    # Non-random
+    if variation.get_mode() in [None,"range"]:
+        if (p <= 0).any():
+            log_and_raise_error(logger, "Pulse energy smaller-equals zero. Change your configuration.")
+        return p
+    # Random (rejecting non-positive values and drawing again until all n values are valid)
+    p = p[p > 0]
+    while len(p) < n:
+        log_warning(logger, "%i pulse energies smaller-equals zero. Try again." % (n - len(p)))
+        q = numpy.asarray(variation.get_batch(pulse_energy_mean, n - len(p)), dtype=numpy.float64)
+        p = numpy.concatenate((p, q[q > 0]))
+    return p
@@ -47,13 +47,35 @@ logger = logging.getLogger(__name__)
 from .log import log_and_raise_error,log_warning,log_info,log_debug
 import condor
 
+# Parsed configuration files keyed by (path, modification time, size, inode)
+_configfile_cache = {}
+
 def read_configfile(configfile):
     """
     Read configuration file to dictionary
+
+    The parsed file is cached and only read again if it has been modified in the meantime.
     """
+    path = os.path.realpath(configfile)
+    st = os.stat(path)
+    # The modification time alone may not change if the file is rewritten within the timestamp resolution of the filesystem (up to 2 sec)
+    key = (path, getattr(st, "st_mtime_ns", st.st_mtime), st.st_size, st.st_ino)
+    if key not in _configfile_cache:
+        # Forget older versions of the same file
+        for k in [k for k in _configfile_cache if k[0] == path]:
+            del _configfile_cache[k]
+        _configfile_cache[key] = _read_configfile(path)
+    # Hand out a copy so that the caller can modify the dictionary without affecting the cache
+    return copy.deepcopy(_configfile_cache[key])
+
+def _read_configfile(configfile):
     config = configparser.ConfigParser()
     with open(configfile,"r") as f:
-        config.readfp(f)
+        if hasattr(config, "read_file"):
+            config.read_file(f)
+        else:
+            # Python 2 (readfp was removed in Python 3.12)
+            config.readfp(f)
         confDict = {}
         for section in config.sections(): 
             confDict[section] = {}
@@ -32,6 +32,11 @@
 
 from __future__ import print_function, absolute_import # Compatibility with python 2 and 3
 import numpy, math
+try:
+    # Multithreaded FFTs (scipy >= 1.4)
+    import scipy.fft as _fft
+except ImportError:
+    _fft = None
  
 def crystallographic_resolution(wavelength, pixel_center_distance, detector_distance):
     r"""
@@ -133,3 +138,49 @@ def polarization_factor(x, y, detector_distance, polarization="ignore"):
         elif polarization == "unpolarized":
             P = 0.5*( 1. + numpy.cos( numpy.arcsin(numpy.sqrt(x**2+y**2)/r) )**2 )
     return P
+
+def real_space_image(data_fourier):
+    """
+    Returns the real space image for a diffraction pattern of complex amplitudes (for example ``data_fourier`` in the output of :meth:`condor.experiment.Experiment.propagate`), i.e. the inverse Fourier transform with the zero frequency and the zero position in the center of the array
+
+    Non-finite values in the pattern are treated as zeros.
+
+    Args:
+      :data_fourier (array): Complex amplitudes with the zero frequency in the center of the array
+    """
+    data_fourier = numpy.asarray(data_fourier)
+    checkerboards = _get_checkerboards(data_fourier.shape)
+    # The copy (shifted or multiplied) is sanitised in place, the input array is left untouched
+    if checkerboards is None:
+        F = numpy.fft.ifftshift(data_fourier)
+    else:
+        with numpy.errstate(invalid="ignore"):
+            # Complex infinities turn into NaNs here, they are zeroed below together with the others
+            F = data_fourier * checkerboards[0]
+    F[~numpy.isfinite(F)] = 0.
+    if _fft is not None:
+        f = _fft.ifftn(F, workers=-1, overwrite_x=True)
+    else:
+        f = numpy.fft.ifftn(F)
+    if checkerboards is None:
+        return numpy.fft.fftshift(f)
+    f *= checkerboards[1]
+    return f
+
+# Only the checkerboards for the most recent shape are kept, they are as large as the pattern itself
+_checkerboards_cache = {}
+
+def _get_checkerboards(shape):
+    # For even lengths N the shifts around the inverse FFT can be replaced by multiplications with the checkerboard (-1)^(i+j+...),
+    # up to the sign (-1)^(N/2) per axis that is folded into the checkerboard applied to the output
+    if any([n % 2 for n in shape]):
+        return None
+    if shape not in _checkerboards_cache:
+        # Outer product of alternating +1/-1 vectors, avoids the index arrays of numpy.indices (ndim times the size as int64)
+        c = numpy.ones((), dtype=numpy.int8)
+        for n in shape:
+            c = numpy.multiply.outer(c, 1 - 2 * (numpy.arange(n, dtype=numpy.int8) % 2))
+        sign = (-1)**(sum(shape) // 2)
+        _checkerboards_cache.clear()
+        _checkerboards_cache[shape] = (c, c * numpy.int8(sign))
+    return _checkerboards_cache[shape]
@@ -50,6 +50,11 @@ def log(logger, message, lvl, exception=None, rollback=1):
         print("%s is an invalid logger level." % lvl)
         sys.exit(1)
     logcall = logcalls[lvl]
+    # Skip the message formatting and stack inspection below if the message would be discarded anyway
+    if not logger.isEnabledFor(getattr(logging, lvl)):
+        if exception is not None:
+            raise exception(message)
+        return
     # This should maybe go into a handler
     if (logger.getEffectiveLevel() >= logging.INFO) or rollback is None:
         # Short output
@@ -76,6 +81,9 @@ def log_execution_time(logger):
             t1 = time.time()
             r = func(*args, **keyArgs)
             t2 = time.time()
+            # Source inspection is expensive, only do it if the message is going to be logged
+            if not logger.isEnabledFor(logging.DEBUG):
+                return r
             try:
                 filename = inspect.getsourcefile(func)
                 module = inspect.getmodule(func)
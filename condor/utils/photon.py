@@ -40,7 +40,9 @@ logger = logging.getLogger(__name__)
 
 from .log import log_and_raise_error,log_warning,log_info,log_debug
 
-class Photon:
+_HC = constants.c*constants.h
+
+class Photon(object):
     """
     Class for X-ray photon
 
@@ -55,6 +57,8 @@ class Photon:
 
       :frequency (float): Photon frequency in unit Hz
     """
+    __slots__ = ("_energy", "_energy_eV", "_wavelength")
+
     def __init__(self, wavelength=None, energy=None, energy_eV=None, frequency=None):
         if (wavelength is not None and energy is not None) or (wavelength is not None and energy_eV is not None) or (energy is not None and energy_eV is not None):
             log_and_raise_error(logger, "Invalid arguments during initialisation of Photon instance. More than one of the arguments is not None.")
@@ -84,6 +88,9 @@ class Photon:
           :energy (float): Photon energy in unit Joule
         """
         self._energy = energy
+        # Derived quantities are cached here so that the getters do not need to recompute them
+        self._energy_eV = energy/constants.e
+        self._wavelength = _HC/energy
 
     def set_energy_eV(self, energy_eV):
         """
@@ -92,7 +99,8 @@ class Photon:
         Args:
           :energy (float): Photon energy in unit electron volt
         """
-        self._energy = energy_eV*constants.e
+        self.set_energy(energy_eV*constants.e)
+        self._energy_eV = energy_eV
 
 
     def set_wavelength(self, wavelength):
@@ -102,7 +110,8 @@ class Photon:
         Args:
           :wavelength (float): Photon wavelength in unit meter
         """
-        self._energy = constants.c*constants.h/wavelength
+        self.set_energy(_HC/wavelength)
+        self._wavelength = wavelength
 
     def set_frequency(self, frequency):
         """
@@ -111,7 +120,7 @@ class Photon:
         Args:
           :frequency (float): Photon frequency in unit Hertz
         """
-        self._energy = constants.h*frequency
+        self.set_energy(constants.h*frequency)
                                 
             
     def get_energy(self):
@@ -124,14 +133,14 @@ class Photon:
         """
         Return photon energy in unit electron volt
         """
-        return self._energy/constants.e
+        return self._energy_eV
 
 
     def get_wavelength(self):
         """
         Return wavelength in unit meter
         """
-        return constants.c*constants.h/self._energy
+        return self._wavelength
 
     def get_frequency(self):
         """
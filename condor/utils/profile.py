@@ -31,14 +31,19 @@
 # -----------------------------------------------------------------------------------------------------
 
 from __future__ import print_function, absolute_import # Compatibility with python 2 and 3
-import numpy
+import numpy, functools, math
+try:
+    import numba
+except ImportError:
+    # numba is optional, without it the profile is evaluated with plain numpy
+    numba = None
 
 import logging
 logger = logging.getLogger(__name__)
 
 from .log import log_and_raise_error,log_warning,log_info,log_debug
 
-class Profile:
+class Profile(object):
     """
     Class for spatial illumination profile
 
@@ -50,8 +55,21 @@ class Profile:
 
     """
     def __init__(self, model, focus_diameter):
+        self._focus_diameter = None
         self.set_model(model)
         self.focus_diameter = focus_diameter
+
+    @property
+    def focus_diameter(self):
+        """
+        Focus diameter / full-width half maximum in unit meter
+        """
+        return self._focus_diameter
+
+    @focus_diameter.setter
+    def focus_diameter(self, focus_diameter):
+        self._focus_diameter = focus_diameter
+        self._update_radial()
         
     def set_model(self,model):
         """
@@ -71,8 +89,10 @@ class Profile:
 
               - ``\'gaussian\'`` - 2D radially symmetrical Gaussian profile
         """
-        if model is None or model in ["top_hat","pseudo_lorentzian","gaussian"]:
+        if model in _model_ids:
             self._model = model
+            self._model_id = _model_ids[model]
+            self._update_radial()
         else:
             log_and_raise_error(logger, "Pulse profile model %s is not implemented. Change your configuration and try again." % model)
             sys.exit(0)
@@ -87,39 +107,125 @@ class Profile:
         """
         Return radial function of intensity profile
         """
-        if self._model is None:
+        return self._radial
+
+    def evaluate_radial(self, r):
+        """
+        Return the intensity profile (normalised to unit pulse energy) at the given radial distance(s)
+
+        Args:
+          :r (float/array): Radial distance(s) from the beam axis in unit meter
+        """
+        return self._radial(r)
+
+    def evaluate_radial_squared(self, r2):
+        """
+        Return the intensity profile (normalised to unit pulse energy) at the given squared radial distance(s)
+
+        Args:
+          :r2 (float/array): Squared radial distance(s) from the beam axis in unit square meter
+        """
+        return self._radial_squared(r2)
+
+    def _update_radial(self):
+        # The constants of the profile and the radial functions are only recalculated when the model or the focus diameter changes
+        if self._focus_diameter is None:
+            self._radial = None
+            self._radial_squared = None
+            return
+        D = float(self._focus_diameter)
+        self._D_half = D / 2.
+        self._D_half_sq = self._D_half**2
+        self._inv_area = 1. / (numpy.pi * self._D_half_sq)
+        # focus diameter is FWHM of gaussian
+        self._sigma_gauss = D / (2.*numpy.sqrt(2.*numpy.log(2.)))
+        # focus diameter is FWHM of lorentzian
+        self._sigma_lorentz = self._D_half
+        if self._model_id == 0:
             # we always hit with full power
-            p = lambda r: 1. / (numpy.pi * (self.focus_diameter / 2.)**2)
-        elif self._model == "top_hat":
+            params = (self._inv_area, 0., 0., 0.)
+        elif self._model_id == 1:
             # focus diameter is diameter of circular top hat profile
-            def p(r):
-                if numpy.isscalar(r):
-                    return (1.  / (numpy.pi * (self.focus_diameter / 2.)**2)) if r < (self.focus_diameter / 2.) else 0.
-                else:
-                    return (1.  / (numpy.pi * (self.focus_diameter / 2.)**2)) * (r < (self.focus_diameter / 2.))
-        elif self._model == "pseudo_lorentzian":
-            # focus diameter is FWHM of lorentzian
-            sigma = self.focus_diameter / 2.
-            p = lambda r: _pseudo_lorentzian_2dnorm(r, sigma)
-        elif self._model == "gaussian":
-            # focus diameter is FWHM of gaussian
-            sigma = self.focus_diameter / (2.*numpy.sqrt(2.*numpy.log(2.)))
-            p = lambda r: _gaussian_2dnorm(r, sigma)
-        return p
-            
-_gaussian = lambda x, sigma: numpy.exp(-x**2/(2*sigma**2))
-
-_gaussian_2dnorm = lambda x, sigma: _gaussian(x, sigma) / ( 2 * numpy.pi * sigma**2 )
-
-_lorentzian = lambda x, sigma: sigma**2 / (x**2 + sigma**2)
-
+            params = (self._inv_area, self._D_half_sq, 0., 0.)
+        elif self._model_id == 2:
+            s1 = _pseudo_lorenzian_s1*self._sigma_lorentz
+            s2 = _pseudo_lorenzian_s2*self._sigma_lorentz
+            norm = 1. / (2. * numpy.pi * (_pseudo_lorenzian_A1 * s1**2 + _pseudo_lorenzian_A2 * s2**2))
+            params = (norm * _pseudo_lorenzian_A1, 1. / (2. * s1**2), norm * _pseudo_lorenzian_A2, 1. / (2. * s2**2))
+        else:
+            params = (1. / (2. * numpy.pi * self._sigma_gauss**2), 1. / (2. * self._sigma_gauss**2), 0., 0.)
+        kwargs = {"model_id": self._model_id, "params": params}
+        self._radial = functools.partial(_evaluate_radial, **kwargs)
+        self._radial_squared = functools.partial(_evaluate_radial_squared, **kwargs)
+
+# Model names mapped to the integer identifiers used by the radial profile kernel
+_model_ids = {None: 0, "top_hat": 1, "pseudo_lorentzian": 2, "gaussian": 3}
+
+def _evaluate_radial_squared(r2, model_id, params):
+    if isinstance(r2, float):
+        # Single position (one particle per shot), numpy call overhead would dominate
+        return _radial_squared_scalar(r2, model_id, params)
+    r2 = numpy.asarray(r2, dtype=numpy.float64)
+    if _radial_squared_parallel is not None and r2.size >= _parallel_min_size:
+        return _radial_squared_parallel(r2.ravel(), model_id, params).reshape(r2.shape)
+    return _radial_squared_numpy(r2, model_id, params)[()]
+
+def _evaluate_radial(r, model_id, params):
+    r = numpy.asarray(r, dtype=numpy.float64)
+    return _evaluate_radial_squared(r*r, model_id, params)
+
+# Fit of a Lorentzian profile by two Gaussian profiles
 _pseudo_lorenzian_A1 = 0.74447313315648778 
 _pseudo_lorenzian_A2 = 0.22788162774723308
 _pseudo_lorenzian_s1 = 0.73985516665883544
 _pseudo_lorenzian_s2 = 2.5588165723260907
-_pseudo_lorentzian = lambda x, sigma: _pseudo_lorenzian_A1 * _gaussian(x, _pseudo_lorenzian_s1*sigma) + \
-                                      _pseudo_lorenzian_A2 * _gaussian(x, _pseudo_lorenzian_s2*sigma)
-
-_pseudo_lorentzian_2dnorm = lambda x, sigma: _pseudo_lorentzian(x, sigma) / ( 2. * numpy.pi * ( _pseudo_lorenzian_A1 * (_pseudo_lorenzian_s1*sigma)**2 + \
-                                                                                                _pseudo_lorenzian_A2 * (_pseudo_lorenzian_s2*sigma)**2 ) )
 
+# Radial profile kernels. The parameters (a, b, c, d) are precalculated by Profile._update_radial:
+#   flat:              a
+#   top hat:           a if r2 < b else 0
+#   pseudo-lorentzian: a exp(-b r2) + c exp(-d r2)
+#   gaussian:          a exp(-b r2)
+
+def _radial_squared_scalar(r2, model_id, params):
+    a, b, c, d = params
+    if model_id == 0:
+        return a
+    elif model_id == 1:
+        return a if r2 < b else 0.
+    elif model_id == 2:
+        return a * math.exp(-b * r2) + c * math.exp(-d * r2)
+    else:
+        return a * math.exp(-b * r2)
+
+def _radial_squared_numpy(r2, model_id, params):
+    a, b, c, d = params
+    if model_id == 0:
+        return numpy.full(r2.shape, a)
+    elif model_id == 1:
+        return a * (r2 < b)
+    elif model_id == 2:
+        return a * numpy.exp(-b * r2) + c * numpy.exp(-d * r2)
+    else:
+        return a * numpy.exp(-b * r2)
+
+def _radial_squared_loop(r2, model_id, params):
+    a, b, c, d = params
+    p = numpy.empty(r2.size)
+    for i in numba.prange(r2.size):
+        if model_id == 0:
+            p[i] = a
+        elif model_id == 1:
+            p[i] = a if r2[i] < b else 0.
+        elif model_id == 2:
+            p[i] = a * numpy.exp(-b * r2[i]) + c * numpy.exp(-d * r2[i])
+        else:
+            p[i] = a * numpy.exp(-b * r2[i])
+    return p
+
+# The vectorised numpy kernel is at least as fast as the compiled loop on a single thread, so the compiled loop
+# is only used for large arrays when numba can distribute the work over several threads
+_parallel_min_size = 100000
+if numba is None or numba.config.NUMBA_NUM_THREADS < 2:
+    _radial_squared_parallel = None
+else:
+    _radial_squared_parallel = numba.njit(cache=True, fastmath=True, parallel=True)(_radial_squared_loop)
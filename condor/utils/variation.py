@@ -152,8 +152,9 @@ class Variation:
         mode = self.get_mode()
         if mode == "range":
             if self._number_of_dimensions == 1:
-                return numpy.array([numpy.linspace(-self._spread/2.,self._spread/2.,n)])
+                return numpy.array([numpy.linspace(-self._spread[0]/2.,self._spread[0]/2.,self.n)])
             elif self._number_of_dimensions == 2:
+                n = self.n
                 Y,X = numpy.meshgrid(numpy.linspace(-self._spread[0]/2.,self._spread[0]/2.,n),numpy.linspace(-self._spread[1]/2.,self._spread[1]/2.,n),indexing="ij")
                 return numpy.array([Y.flatten(),X.flatten()])
             elif self._number_of_dimensions == 3:
@@ -208,6 +209,45 @@ class Variation:
         self._i += 1        
         return v1
         
+    def get_batch(self, v0, n):
+        """
+        Get the next ``n`` values at once
+
+        The result is equivalent to ``n`` calls of :meth:`condor.utils.variation.Variation.get` but random values are drawn in one vectorised call.
+
+        Args:
+          :v0 (float/int/array): Value(s) without variational deviation
+
+          :n (int): Number of values
+
+        Returns an array of shape ``(n,)`` for one dimension and ``(n, number_of_dimensions)`` otherwise.
+        """
+        if self._number_of_dimensions == 1:
+            v1 = self._get_batch_for_one_dim(v0,0,n)
+        else:
+            v1 = []
+            for dim in range(self._number_of_dimensions):
+                v1.append(self._get_batch_for_one_dim(v0[dim],dim,n))
+            v1 = numpy.array(v1).T
+        self._i += n
+        return v1
+
+    def _get_batch_for_one_dim(self,v0,dim,n):
+        if self._mode is None:
+            v1 = numpy.full(n, v0)
+        elif self._mode == "normal":
+            v1 = numpy.random.normal(v0,self._spread[dim],n) if (self._spread[dim] > 0) else numpy.full(n, v0)
+        elif self._mode == "normal_poisson":
+            v1 = numpy.random.normal(numpy.random.poisson(v0,n),self._spread[dim])
+        elif self._mode == "poisson":
+            v1 = numpy.random.poisson(v0,n)
+        elif self._mode == "uniform":
+            v1 = numpy.random.uniform(v0-self._spread[dim]/2.,v0+self._spread[dim]/2.,n) if (self._spread[dim] > 0) else numpy.full(n, v0)
+        elif self._mode == "range":
+            g = self._get_grid()
+            v1 = v0 + g[dim,(self._i + numpy.arange(n)) % g.shape[1]]
+        return v1
+
     def _get_values_for_one_dim(self,v0,dim):
         if self._mode is None:
             v1 = v0
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 """
-Pickle constants data form text tables
+Write the atomic data tables (condor/data/*.npy, indexed by atomic number) from the text tables in data/
 """
 # -----------------------------------------------------------------------------------------------------
 # CONDOR
@@ -35,14 +35,14 @@ Pickle constants data form text tables
 # -----------------------------------------------------------------------------------------------------
 
 from __future__ import print_function, absolute_import # Compatibility with python 2 and 3
-import os, glob, numpy, pickle, sys, re
+import os, glob, numpy, sys, re
 
 repodir = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..')
 datadir = os.path.join(repodir, 'data')
 srcdir = os.path.join(repodir, 'condor')
 
 
-def pickle_atomic_scattering_factors(inpath, outpath): 
+def read_atomic_scattering_factors(inpath):
     S = {}
     for infile in glob.glob(os.path.join("./", '%s/*.nff' % (inpath)) ):
         regexp = re.search("%s/([a-z]+).nff$" % (inpath),infile)
@@ -56,11 +56,9 @@ def pickle_atomic_scattering_factors(inpath, outpath):
                 if float(arg[1]) > 0:
                     S[el].append([float(arg[0]),float(arg[1]),float(arg[2])])
         S[el] = numpy.array(S[el])
-        
-    with open(os.path.join(outpath, 'sf.dat'),'wb') as f:
-        pickle.dump(S, f, protocol=2)
+    return S
 
-def pickle_atomic_standard_weights_and_numbers(inpath, outpath):
+def read_atomic_standard_weights_and_numbers(inpath):
     with open(inpath + "/standard_weights.txt", "r") as f:
         lines = f.readlines()
     # Skip the header
@@ -81,13 +79,19 @@ def pickle_atomic_standard_weights_and_numbers(inpath, outpath):
         w = float(w)
         W[s] = w
         Z[s] = z
+    return W, Z
 
-    with open(outpath + "/sw.dat", "wb") as f:
-        pickle.dump(W, f, protocol=2)
-
-    with open(outpath + "/z.dat", "wb") as f:
-        pickle.dump(Z, f, protocol=2)
-
+def save_tables(outpath, S, W, Z):
+    # Tables indexed by atomic number (see condor/_load_data.py for the file format)
+    z_max = max(Z.values())
+    elements = [""]*(z_max+1)
+    for s, z in Z.items():
+        elements[z] = s
+    numpy.save(os.path.join(outpath, "elements.npy"), numpy.array(elements, dtype="U"))
+    numpy.save(os.path.join(outpath, "sw.npy"), numpy.array([W[s] if s in W else numpy.nan for s in elements], dtype=numpy.float64))
+    sf = [S[s] if s in S else numpy.zeros(shape=(0,3)) for s in elements]
+    numpy.save(os.path.join(outpath, "sf.npy"), numpy.concatenate(sf).astype(numpy.float64))
+    numpy.save(os.path.join(outpath, "sf_offsets.npy"), numpy.cumsum([0] + [len(f) for f in sf]).astype(numpy.int64))
 
 
 if __name__ == "__main__":
@@ -96,11 +100,8 @@ if __name__ == "__main__":
     # B.L. Henke, E.M. Gullikson, and J.C. Davis. X-ray interactions: photoabsorption, scattering, transmission, and reflection at E=50-30000 eV, Z=1-92
     # Atomic Data and Nuclear Data Tables Vol. 54 (no.2), 181-342 (July 1993).
     # http://henke.lbl.gov/optical_constants/asf.html
-    print('Generate data file with atomic scattering constants...')
-    pickle_atomic_scattering_factors(
-        inpath=os.path.join(datadir, "sf"),
-        outpath=os.path.join(srcdir, 'data'),
-    )
+    print('Read atomic scattering constants...')
+    S = read_atomic_scattering_factors(inpath=os.path.join(datadir, "sf"))
     print('Done.')
     
     # Standard atomic weights from the IUPAC tables
@@ -108,10 +109,10 @@ if __name__ == "__main__":
     # ISSN (Online) 1365-3075, ISSN (Print) 0033-4545
     # DOI: 10.1351/PAC-REP-13-03-02, April 2013
     # Data loaded from: http://www.chem.qmul.ac.uk/iupac/AtWt/ table 2 (2015/07/01)
-    print('Generate data file with atomic standard weight constants...')
-    pickle_atomic_standard_weights_and_numbers(
-        inpath=os.path.join(datadir, "sw"),
-        outpath=os.path.join(srcdir, 'data')
-    )
+    print('Read atomic standard weight constants...')
+    W, Z = read_atomic_standard_weights_and_numbers(inpath=os.path.join(datadir, "sw"))
     print('Done.')
 
+    print('Generate data files...')
+    save_tables(os.path.join(srcdir, 'data'), S, W, Z)
+    print('Done.')
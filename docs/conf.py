@@ -24,11 +24,12 @@ import shlex
 
 import socket
 if socket.gethostname() == "login":
-    print "On login..."
+    print("On login...")
     THIS_DIR = os.path.dirname(os.path.realpath(__file__))
     venv_path = THIS_DIR+"/../../virtualenv/"
     activate_this = os.path.join(venv_path, "bin/activate_this.py")
-    execfile(activate_this, dict(__file__=activate_this))
+    with open(activate_this) as f:
+        exec(f.read(), dict(__file__=activate_this))
 
 #sys.path.insert(0, os.path.abspath('./../../'))
 #print sys.path
@@ -1,13 +1,20 @@
 #!/usr/bin/env python
 from __future__ import print_function, absolute_import # Compatibility with python 2 and 3
-import os
+import os, subprocess
+from multiprocessing.pool import ThreadPool
 
 repodir = os.path.dirname(os.path.realpath(__file__))
 examplesdir_configfile = os.path.join(repodir, "examples", "configfile")
 examplesdir_scripts = os.path.join(repodir, "examples", "scripts")
 examplesdir_publication = os.path.join(repodir, "examples_publication")
 
-def run_examples(on_travis=False):
+def _run_example(e):
+    cmd = "cd %s; %s" % (e["dir"],e["cmd"])
+    p = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = p.communicate()[0]
+    return cmd, output.decode("utf-8", "replace"), p.returncode
+
+def run_examples(on_travis=False, processes=None):
 
     examples = [
         {
@@ -118,19 +125,25 @@ def run_examples(on_travis=False):
         examples = [e for e in examples if e["travis"]]
 
     nerrors = 0
-        
+
+    # The examples are independent of each other and run in parallel (each in its own subprocess),
+    # their output is printed in order once all of them have finished
+    pool = ThreadPool(processes)
+    results = pool.map(_run_example, examples)
+    pool.close()
+    pool.join()
+
     print("-"*100)
     print("")
-    for i,e in enumerate(examples):
+    for i,(e,(cmd,output,error)) in enumerate(zip(examples, results)):
         print(">>> Example %i/%i: %s" % (i+1, len(examples), e["name"]))
-        cmd = "cd %s; %s" % (e["dir"],e["cmd"])
         print(cmd)
         print("[start output]")
-        error = os.system(cmd)
+        print(output, end="")
         print("[end output]")
         if error != 0:
             nerrors += 1
-            raise Exception(">>> Example %i (%s) failed. Abort." % (i+1,e["name"]))
+            print(">>> Example %i (%s) failed." % (i+1,e["name"]))
         else:
             print(">>> Success!")
         print("")
@@ -141,6 +154,7 @@ def run_examples(on_travis=False):
         print("SUCCESS: All examples finished successfully.")
     else:
         print("ERROR: %i/%i example(s) failed." % (nerrors, len(examples)))
+        raise Exception(">>> %i example(s) failed." % nerrors)
 
 
 if __name__ == "__main__":
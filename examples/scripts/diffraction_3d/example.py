@@ -40,7 +40,4 @@ intensities_3d = abs(img_3d)**2
 phases_3d = np.angle(img_3d)
 
 # Real space object
-tmp = img_3d.copy()
-tmp[np.isnan(tmp)] = 0.
-tmp = np.fft.fftshift(tmp)
-rs_3d = np.fft.fftshift(np.fft.ifftn(tmp))
+rs_3d = condor.utils.diffraction.real_space_image(img_3d)
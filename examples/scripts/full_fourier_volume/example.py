@@ -29,14 +29,14 @@ for i,par in enumerate(particles):
     res = E.propagate()
     data = res["entry_1"]["data_1"]["data"]
     if do_plot:
-        axs1[i].set_title("2D: " + par.keys()[0])
+        axs1[i].set_title("2D: " + next(iter(par.keys())))
         lims = (data.min(), data.max())
         axs1[i].imshow(data, norm=LogNorm(lims[0], lims[1]), cmap="gnuplot")
         
     res = E.propagate3d()
     data = res["entry_1"]["data_1"]["data"][int(1024/ds/2),:,:] 
     if do_plot:
-        axs2[i].set_title("3D slice: " + par.keys()[0])
+        axs2[i].set_title("3D slice: " + next(iter(par.keys())))
         axs2[i].imshow(data, norm=LogNorm(lims[0], lims[1]), cmap="gnuplot")
 
 if do_plot:
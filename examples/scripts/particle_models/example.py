@@ -29,7 +29,7 @@ s = "particle_sphere"
 E = condor.Experiment(src, {s : par}, det)
 res = E.propagate()
 if plotting:
-    real_space = numpy.fft.fftshift(numpy.fft.ifftn(res["entry_1"]["data_1"]["data_fourier"]))
+    real_space = condor.utils.diffraction.real_space_image(res["entry_1"]["data_1"]["data_fourier"])
     pypl.imsave(this_dir + "/simple_test_%s.png" % s, numpy.log10(res["entry_1"]["data_1"]["data"]))
     pypl.imsave(this_dir + "/simple_test_%s_rs.png" % s, abs(real_space))
 
@@ -40,7 +40,7 @@ s = "particle_spheroid"
 E = condor.Experiment(src, {s : par}, det)
 res = E.propagate()
 if plotting:
-    real_space = numpy.fft.fftshift(numpy.fft.ifftn(res["entry_1"]["data_1"]["data_fourier"]))
+    real_space = condor.utils.diffraction.real_space_image(res["entry_1"]["data_1"]["data_fourier"])
     pypl.imsave(this_dir + "/simple_test_%s.png" % s, numpy.log10(res["entry_1"]["data_1"]["data"]))
     pypl.imsave(this_dir + "/simple_test_%s_rs.png" % s, abs(real_space))
 
@@ -51,7 +51,7 @@ s = "particle_map_icosahedron"
 E = condor.Experiment(src, {s : par}, det)
 res = E.propagate()
 if plotting:
-    real_space = numpy.fft.fftshift(numpy.fft.ifftn(res["entry_1"]["data_1"]["data_fourier"]))
+    real_space = condor.utils.diffraction.real_space_image(res["entry_1"]["data_1"]["data_fourier"])
     pypl.imsave(this_dir + "/simple_test_%s.png" % s, numpy.log10(res["entry_1"]["data_1"]["data"]))
     pypl.imsave(this_dir + "/simple_test_%s_rs.png" % s, abs(real_space))
 
@@ -62,6 +62,6 @@ s = "particle_atoms"
 E = condor.Experiment(src, {s : par}, det)
 res = E.propagate()
 if plotting:
-    real_space = numpy.fft.fftshift(numpy.fft.ifftn(res["entry_1"]["data_1"]["data_fourier"]))
+    real_space = condor.utils.diffraction.real_space_image(res["entry_1"]["data_1"]["data_fourier"])
     pypl.imsave(this_dir + "/simple_test_%s.png" % s, numpy.log10(res["entry_1"]["data_1"]["data"]))
     pypl.imsave(this_dir + "/simple_test_%s_rs.png" % s, abs(real_space))
@@ -38,7 +38,7 @@ for i in range(N):
     res = E.propagate()
     #print(time.time()-t)
     if plotting:
-        real_space = numpy.fft.fftshift(numpy.fft.ifftn(res["entry_1"]["data_1"]["data_fourier"]))
+        real_space = condor.utils.diffraction.real_space_image(res["entry_1"]["data_1"]["data_fourier"])
         pypl.imsave(this_dir + "/%i.png" % (i), numpy.log10(res["entry_1"]["data_1"]["data"]))
         pypl.imsave(this_dir + "/%i_rs.png" % (i), abs(real_space))
     W.write(res)
@@ -51,6 +51,6 @@ W.write(res)
 W.close()
 
 if plotting:
-    real_space = numpy.fft.fftshift(numpy.fft.ifftn(res["entry_1"]["data_1"]["data_fourier"]))
+    real_space = condor.utils.diffraction.real_space_image(res["entry_1"]["data_1"]["data_fourier"])
     pypl.imsave(this_dir + "/intensities.png", numpy.log10(res["entry_1"]["data_1"]["data"]))
     pypl.imsave(this_dir + "/real_space.png", abs(real_space), cmap="binary")
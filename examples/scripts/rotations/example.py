@@ -63,7 +63,7 @@ for angle_d in angles_d:
         s = "particle_spheroid"
         E = condor.Experiment(src, {s : par}, det)
         res = E.propagate()
-        real_space = numpy.fft.fftshift(numpy.fft.ifftn(res["entry_1"]["data_1"]["data_fourier"]))
+        real_space = condor.utils.diffraction.real_space_image(res["entry_1"]["data_1"]["data_fourier"])
         vmin = numpy.log10(res["entry_1"]["data_1"]["data"].max()/10000.)
         if plotting:
             pypl.imsave(out_dir + "/%s_%2.2fdeg.png" % (s,angle_d), numpy.log10(res["entry_1"]["data_1"]["data"]), vmin=vmin)
@@ -76,7 +76,7 @@ for angle_d in angles_d:
         s = "particle_map_spheroid"
         E = condor.Experiment(src, {s : par}, det)
         res = E.propagate()
-        real_space = numpy.fft.fftshift(numpy.fft.ifftn(res["entry_1"]["data_1"]["data_fourier"]))
+        real_space = condor.utils.diffraction.real_space_image(res["entry_1"]["data_1"]["data_fourier"])
         vmin = numpy.log10(res["entry_1"]["data_1"]["data"].max()/10000.)
         if plotting:
             pypl.imsave(out_dir + "/%s_%2.2f.png" % (s,angle_d), numpy.log10(res["entry_1"]["data_1"]["data"]), vmin=vmin)
@@ -98,7 +98,7 @@ for angle_d in angles_d:
         if plotting:
             data_fourier = res["entry_1"]["data_1"]["data_fourier"]
             #data_fourier = abs(data_fourier)*numpy.exp(-1.j*numpy.angle(data_fourier))
-            real_space = numpy.fft.fftshift(numpy.fft.ifftn(numpy.fft.fftshift(data_fourier)))
+            real_space = condor.utils.diffraction.real_space_image(data_fourier)
             vmin = numpy.log10(res["entry_1"]["data_1"]["data"].max()/10000.)
             pypl.imsave(out_dir + "/%s_map.png" % (s),map3d.sum(0))
             pypl.imsave(out_dir + "/%s_%2.2f.png" % (s,angle_d), numpy.log10(res["entry_1"]["data_1"]["data"]), vmin=vmin)
@@ -132,7 +132,7 @@ for angle_d in angles_d:
         E = condor.Experiment(src, {s : par}, det)
         res = E.propagate()
         if plotting:
-            real_space = numpy.fft.fftshift(numpy.fft.ifftn(numpy.fft.fftshift(res["entry_1"]["data_1"]["data_fourier"])))
+            real_space = condor.utils.diffraction.real_space_image(res["entry_1"]["data_1"]["data_fourier"])
             fourier_space = res["entry_1"]["data_1"]["data_fourier"]
             vmin = numpy.log10(res["entry_1"]["data_1"]["data"].max()/10000.)
             pypl.imsave(out_dir + "/%s_%2.2f.png" % (s,angle_d), numpy.log10(res["entry_1"]["data_1"]["data"]), vmin=vmin)
@@ -18,4 +18,4 @@ res = E.propagate()
 
 # Arrays for Fourier and real space
 data_fourier = res["entry_1"]["data_1"]["data_fourier"]
-real_space = numpy.fft.fftshift(numpy.fft.ifftn(data_fourier))
+real_space = condor.utils.diffraction.real_space_image(data_fourier)
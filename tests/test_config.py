@@ -0,0 +1,37 @@
+import unittest
+import os, shutil, tempfile
+from condor.utils import config
+
+class TestCaseConfig(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "condor.conf")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _write(self, text, mtime_ns=None):
+        with open(self.filename, "w") as f:
+            f.write(text)
+        if mtime_ns is not None:
+            os.utime(self.filename, ns=(mtime_ns, mtime_ns))
+
+    def test_rewrite_invalidates_cache(self):
+        self._write("[source]\nwavelength = 1E-10\n")
+        mtime_ns = os.stat(self.filename).st_mtime_ns
+        self.assertEqual(config.read_configfile(self.filename)["source"]["wavelength"], 1E-10)
+        # Rewritten within the timestamp resolution of the filesystem
+        self._write("[source]\nwavelength = 2.5E-10\n", mtime_ns=mtime_ns)
+        self.assertEqual(config.read_configfile(self.filename)["source"]["wavelength"], 2.5E-10)
+        # Modified later
+        self._write("[source]\nwavelength = 3E-10\n", mtime_ns=mtime_ns + 10**9)
+        self.assertEqual(config.read_configfile(self.filename)["source"]["wavelength"], 3E-10)
+
+    def test_copy(self):
+        self._write("[source]\nwavelength = 1E-10\n")
+        C = config.read_configfile(self.filename)
+        C["source"]["wavelength"] = 5E-10
+        C["detector"] = {}
+        C = config.read_configfile(self.filename)
+        self.assertEqual(C["source"]["wavelength"], 1E-10)
+        self.assertNotIn("detector", C)
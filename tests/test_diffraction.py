@@ -1,4 +1,5 @@
-import unittest
+import unittest, warnings
+import numpy
 from condor.utils import diffraction
 
 class TestCaseDiffraction(unittest.TestCase):
@@ -22,3 +23,40 @@ class TestCaseDiffraction(unittest.TestCase):
         nypx_expected  = 0.01
         nypx = diffraction.nyquist_pixel_size(wavelength, detector_distance, particle_size)
         self.assertAlmostEqual(nypx/1E-3 , nypx_expected/1E-3, 1)
+
+    def test_real_space_image_shapes(self):
+        # Checkerboard multiplications (even lengths) and explicit shifts (odd lengths) agree with the shift-based reference
+        for shape in [(8,), (9,), (6, 10), (4, 6), (7, 5), (6, 7), (4, 6, 8), (4, 5, 6), (2, 2, 2, 2)]:
+            A = numpy.random.rand(*shape) + 1j*numpy.random.rand(*shape)
+            reference = numpy.fft.fftshift(numpy.fft.ifftn(numpy.fft.ifftshift(A)))
+            self.assertTrue(numpy.allclose(diffraction.real_space_image(A), reference), shape)
+
+    def test_real_space_image_inf(self):
+        A = numpy.ones((4, 4), dtype=numpy.complex128)
+        A[1, 2] = numpy.inf
+        A[2, 1] = -numpy.inf
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            diffraction.real_space_image(A)
+
+    def test_real_space_image(self):
+        for shape in [(16, 16), (15, 16)]:
+            A = numpy.random.rand(*shape) + 1j*numpy.random.rand(*shape)
+            A[3, 4] = numpy.nan
+            A[5, 6] = numpy.inf
+            A[7, 8] = -numpy.inf*1j
+            A0 = A.copy()
+            B = A.copy()
+            B[~numpy.isfinite(B)] = 0.
+            reference = numpy.fft.fftshift(numpy.fft.ifftn(numpy.fft.ifftshift(B)))
+            f = diffraction.real_space_image(A)
+            self.assertTrue(numpy.isfinite(f).all())
+            self.assertTrue(numpy.allclose(f, reference))
+            # Input is left untouched
+            self.assertTrue(((A == A0) | (numpy.isnan(A) & numpy.isnan(A0))).all())
+
+    def test_real_space_image_cache(self):
+        # Checkerboards are only cached for the most recent shape
+        for shape in [(4, 4), (6, 8), (2, 4, 6)]:
+            diffraction.real_space_image(numpy.ones(shape))
+        self.assertEqual(list(diffraction._checkerboards_cache.keys()), [(2, 4, 6)])
@@ -0,0 +1,55 @@
+import unittest
+import condor
+
+class TestCaseExperiment(unittest.TestCase):
+    def setUp(self):
+        self.src = condor.Source(wavelength=0.1E-9, pulse_energy=1E-3, focus_diameter=1E-6)
+        self.det = condor.Detector(distance=0.5, pixel_size=750E-6, nx=10, ny=10)
+        self.conf = {
+            "source": {"wavelength": 0.1E-9, "pulse_energy": 1E-3, "focus_diameter": 1E-6},
+            "particle_sphere": {"diameter": 100E-9, "material_type": "water"},
+            "detector": {"distance": 0.5, "pixel_size": 750E-6, "nx": 10, "ny": 10},
+        }
+
+    def test_precision_get_conf(self):
+        E = condor.Experiment(self.src, {}, self.det, precision="single")
+        self.assertEqual(E.get_conf()["experiment"], {"precision": "single"})
+
+    def test_precision_from_configdict(self):
+        # Section is optional
+        E = condor.experiment.experiment_from_configdict(self.conf)
+        self.assertEqual(E.precision, "double")
+        self.conf["experiment"] = {"precision": "single"}
+        E = condor.experiment.experiment_from_configdict(self.conf)
+        self.assertEqual(E.precision, "single")
+
+    def test_particle_spheroid(self):
+        # "particle_spheroid" also starts with "particle_sphere"
+        del self.conf["particle_sphere"]
+        self.conf["particle_spheroid"] = {"diameter": 100E-9, "material_type": "water", "flattening": 0.8}
+        E = condor.experiment.experiment_from_configdict(self.conf)
+        self.assertIsInstance(E.particles["particle_spheroid"], condor.ParticleSpheroid)
+        par = condor.ParticleSpheroid(diameter=100E-9, material_type="water", flattening=0.8)
+        E = condor.Experiment(self.src, {"particle_spheroid": par}, self.det)
+        self.assertIs(E.particles["particle_spheroid"], par)
+
+    def test_version_tuple(self):
+        vt = condor.experiment._version_tuple
+        self.assertEqual(vt("0.1"), vt("0.1.0"))
+        self.assertFalse(vt("0.1") < vt("0.1.0"))
+        self.assertTrue(vt("0.1.0") < vt("0.1.1"))
+        self.assertTrue(vt("0.9.2") < vt("0.10"))
+        self.assertEqual(vt("1.2.3rc1"), (1, 2, 3))
+
+    def test_linear_sampling_ratio(self):
+        # o = D lambda / (d p)
+        o = 0.5 * 0.1E-9 / (100E-9 * 750E-6)
+        E = condor.Experiment(self.src, {"particle_sphere": condor.ParticleSphere(diameter=100E-9, material_type="water")}, self.det)
+        self.assertAlmostEqual(E.get_linear_sampling_ratio(), o)
+        self.assertAlmostEqual(E.get_linear_sampling_ratio(wavelength=0.2E-9, particle_diameter=50E-9), 4*o)
+        particles = {"particle_sphere": condor.ParticleSphere(diameter=100E-9, material_type="water"),
+                     "particle_sphere_2": condor.ParticleSphere(diameter=200E-9, material_type="water")}
+        E = condor.Experiment(self.src, particles, self.det)
+        # Ambiguous without particle_key
+        self.assertRaises(RuntimeError, E.get_linear_sampling_ratio)
+        self.assertAlmostEqual(E.get_linear_sampling_ratio(particle_key="particle_sphere_2"), o/2.)
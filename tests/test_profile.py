@@ -0,0 +1,66 @@
+import unittest
+import numpy
+from condor.utils import profile
+
+def _expected(model, D, r):
+    r = numpy.asarray(r, dtype=numpy.float64)
+    if model is None:
+        return numpy.ones(r.shape) / (numpy.pi * (D/2.)**2)
+    elif model == "top_hat":
+        return (r < D/2.) / (numpy.pi * (D/2.)**2)
+    elif model == "pseudo_lorentzian":
+        s1 = profile._pseudo_lorenzian_s1 * D/2.
+        s2 = profile._pseudo_lorenzian_s2 * D/2.
+        A1 = profile._pseudo_lorenzian_A1
+        A2 = profile._pseudo_lorenzian_A2
+        return (A1 * numpy.exp(-r**2/(2*s1**2)) + A2 * numpy.exp(-r**2/(2*s2**2))) / (2 * numpy.pi * (A1 * s1**2 + A2 * s2**2))
+    elif model == "gaussian":
+        s = D / (2*numpy.sqrt(2*numpy.log(2)))
+        return numpy.exp(-r**2/(2*s**2)) / (2 * numpy.pi * s**2)
+
+class TestCaseProfile(unittest.TestCase):
+    models = [None, "top_hat", "pseudo_lorentzian", "gaussian"]
+
+    def _check(self, P, D):
+        r = numpy.linspace(0., 2*D, 101).reshape((1, 101))
+        for rr in [r, 0.3*D, 0.7*D]:
+            expected = _expected(P.get_model(), D, rr)
+            self.assertTrue(numpy.allclose(P.get_radial()(rr), expected, rtol=1E-12, atol=0))
+            self.assertTrue(numpy.allclose(P.evaluate_radial(rr), expected, rtol=1E-12, atol=0))
+            self.assertTrue(numpy.allclose(P.evaluate_radial_squared(numpy.square(rr)), expected, rtol=1E-12, atol=0))
+            self.assertEqual(numpy.shape(P.evaluate_radial_squared(numpy.square(rr))), numpy.shape(rr))
+
+    def test_models(self):
+        for model in self.models:
+            P = profile.Profile(model, 1E-6)
+            self._check(P, 1E-6)
+            # Constants are recalculated for the new focus diameter
+            P.focus_diameter = 3E-6
+            self._check(P, 3E-6)
+
+    def test_fwhm_and_norm(self):
+        D = 1E-6
+        dr = D / 10000.
+        r = numpy.arange(200000) * dr + dr/2.
+        # The pseudo-Lorentzian profile is only a fit to a Lorentzian, its FWHM is approximately the focus diameter
+        for model, delta in [("pseudo_lorentzian", 0.03), ("gaussian", 1E-12)]:
+            P = profile.Profile(model, D)
+            self.assertAlmostEqual(P.evaluate_radial(D/2.) / P.evaluate_radial(0.), 0.5, delta=delta)
+            # Normalised to unit pulse energy
+            self.assertAlmostEqual((2*numpy.pi*r*P.evaluate_radial(r)).sum() * dr, 1., 6)
+
+    def test_compiled_kernel(self):
+        if profile.numba is None:
+            self.skipTest("numba is not installed")
+        parallel = profile._radial_squared_parallel
+        min_size = profile._parallel_min_size
+        if parallel is None:
+            # Only one thread available, the kernel is not used by default but can still be compiled
+            profile._radial_squared_parallel = profile.numba.njit(fastmath=True, parallel=True)(profile._radial_squared_loop)
+        profile._parallel_min_size = 1
+        try:
+            for model in self.models:
+                self._check(profile.Profile(model, 1E-6), 1E-6)
+        finally:
+            profile._radial_squared_parallel = parallel
+            profile._parallel_min_size = min_size
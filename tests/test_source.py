@@ -0,0 +1,78 @@
+import unittest
+import numpy
+import logging
+logging.getLogger("condor").setLevel("ERROR")
+
+import condor
+
+class TestCaseSource(unittest.TestCase):
+    def test_prefill_pulse_energies(self):
+        kwargs = dict(wavelength=1E-10, focus_diameter=1E-6, pulse_energy=1E-3, pulse_energy_variation="range", pulse_energy_spread=1E-4, pulse_energy_variation_n=3)
+        S0 = condor.Source(**kwargs)
+        S1 = condor.Source(**kwargs)
+        p0 = [S0.get_next()["pulse_energy"] for i in range(8)]
+        S1.prefill_pulse_energies(5)
+        buffered = list(S1._pulse_energy_buffer)
+        p1 = [S1.get_next()["pulse_energy"] for i in range(8)]
+        # The first 5 pulse energies come from the buffer, afterwards they are drawn one by one again
+        self.assertEqual(p1[:5], buffered)
+        self.assertTrue(numpy.allclose(p0, p1))
+
+    def test_prefill_discarded(self):
+        S = condor.Source(wavelength=1E-10, focus_diameter=1E-6, pulse_energy=1E-3, pulse_energy_variation="normal", pulse_energy_spread=1E-4)
+        S.prefill_pulse_energies(5)
+        S.set_pulse_energy_variation(None)
+        self.assertEqual(S.get_next()["pulse_energy"], 1E-3)
+
+    def test_random_pulse_energies_positive(self):
+        numpy.random.seed(0)
+        for mode in ["normal", "uniform"]:
+            # Spread large enough for many non-positive draws that have to be rejected
+            S = condor.Source(wavelength=1E-10, focus_diameter=1E-6, pulse_energy=1E-3, pulse_energy_variation=mode, pulse_energy_spread=4E-3)
+            p = [S.get_next()["pulse_energy"] for i in range(100)]
+            S.prefill_pulse_energies(100)
+            p += [S.get_next()["pulse_energy"] for i in range(100)]
+            self.assertTrue(all([(x is not None) and (x > 0) for x in p]))
+
+    def test_next_batch(self):
+        numpy.random.seed(0)
+        S = condor.Source(wavelength=1E-10, focus_diameter=1E-6, pulse_energy=1E-3, pulse_energy_variation="normal", pulse_energy_spread=2E-3)
+        p = S.get_next_batch(50)["pulse_energy"]
+        self.assertEqual(p.shape, (50,))
+        self.assertTrue((p > 0).all())
+
+    def test_prefill_discarded_by_mean(self):
+        S = condor.Source(wavelength=1E-10, focus_diameter=1E-6, pulse_energy=1E-3)
+        S.prefill_pulse_energies(5)
+        S.pulse_energy_mean = 5E-3
+        self.assertEqual(S.get_next()["pulse_energy"], 5E-3)
+        self.assertEqual(S.get_conf()["source"]["pulse_energy"], 5E-3)
+
+    def test_pulse_energy_type(self):
+        S = condor.Source(wavelength=1E-10, focus_diameter=1E-6, pulse_energy=1E-3, pulse_energy_variation="normal", pulse_energy_spread=1E-4)
+        S.prefill_pulse_energies(1)
+        self.assertIs(type(S.get_next()["pulse_energy"]), float)
+        self.assertIs(type(S.get_next()["pulse_energy"]), float)
+
+    def test_next_batch_after_prefill(self):
+        kwargs = dict(wavelength=1E-10, focus_diameter=1E-6, pulse_energy=1E-3, pulse_energy_variation="range", pulse_energy_spread=1E-4, pulse_energy_variation_n=5)
+        S0 = condor.Source(**kwargs)
+        S1 = condor.Source(**kwargs)
+        p0 = [S0.get_next()["pulse_energy"] for i in range(7)]
+        S1.prefill_pulse_energies(3)
+        p1 = list(S1.get_next_batch(2)["pulse_energy"])
+        p1 += list(S1.get_next_batch(3)["pulse_energy"])
+        p1 += [S1.get_next()["pulse_energy"] for i in range(2)]
+        self.assertTrue(numpy.allclose(p0, p1))
+
+    def test_intensity_units(self):
+        S = condor.Source(wavelength=1E-10, focus_diameter=1E-6, pulse_energy=1E-3, profile_model="gaussian")
+        pos = [0., 2E-7, 1E-7]
+        I = S.profile.evaluate_radial(numpy.sqrt(pos[1]**2 + pos[2]**2)) * 1E-3
+        E_ph = S.photon.get_energy()
+        expected = {"J/m2": I, "ph/m2": I / E_ph, "J/um2": I * 1E-12, "mJ/um2": I * 1E-9, "ph/um2": I / E_ph * 1E-12}
+        for unit, value in expected.items():
+            self.assertAlmostEqual(S.get_intensity(pos, unit=unit) / value, 1., 12)
+        # Explicit pulse energy instead of the mean
+        self.assertAlmostEqual(S.get_intensity(pos, unit="J/m2", pulse_energy=2E-3) / (2*I), 1., 12)
+        self.assertRaises(RuntimeError, S.get_intensity, pos, "invalid")
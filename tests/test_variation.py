@@ -0,0 +1,21 @@
+import unittest
+import numpy
+from condor.utils import variation
+
+class TestCaseVariation(unittest.TestCase):
+    def test_batch_range(self):
+        V0 = variation.Variation("range", 2., n=5)
+        V1 = variation.Variation("range", 2., n=5)
+        v0 = numpy.array([V0.get(1.) for i in range(7)])
+        v1 = V1.get_batch(1., 7)
+        self.assertTrue(numpy.allclose(v0, v1))
+        # Counter continues after the batch
+        self.assertAlmostEqual(V0.get(1.), V1.get(1.))
+
+    def test_batch_random(self):
+        numpy.random.seed(0)
+        V = variation.Variation("normal", [1., 2.], number_of_dimensions=2)
+        v = V.get_batch([10., -10.], 1000)
+        self.assertEqual(v.shape, (1000, 2))
+        self.assertAlmostEqual(v[:,0].mean(), 10., 0)
+        self.assertAlmostEqual(v[:,1].std(), 2., 0)